@@ -3,13 +3,15 @@ Interfaces with the Visonic Alarm control panel.
 """
 
 import logging
-from time import sleep
 from datetime import timedelta
+from functools import lru_cache, partial
 
 import homeassistant.components.alarm_control_panel as alarm
 from homeassistant.components.alarm_control_panel import AlarmControlPanelEntityFeature
 import homeassistant.components.persistent_notification as pn
-from homeassistant.const import ATTR_CODE_FORMAT, EVENT_STATE_CHANGED, STATE_UNKNOWN
+from homeassistant.const import ATTR_CODE_FORMAT, STATE_UNKNOWN
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 
 # -------------------------------------------------------------------
 # Compatibility shim for HA 2025.11+ (STATE_ALARM_* constants removed)
@@ -57,49 +59,121 @@ ATTR_ALARMS = "alarm"
 
 SCAN_INTERVAL = timedelta(seconds=7)  # reduced from 10s to 7s
 
+# Delay before fetching the last event, so quick successive transitions
+# result in a single request to the panel.
+LAST_EVENT_DELAY = 0.5
+
+# Raw (normalized) panel states to Home Assistant alarm states.
+STATE_MAP = {
+    "AWAY": STATE_ALARM_ARMED_AWAY,
+    "ARMED_AWAY": STATE_ALARM_ARMED_AWAY,
+    "ARM": STATE_ALARM_ARMED_AWAY,
+    "HOME": STATE_ALARM_ARMED_HOME,
+    "STAY": STATE_ALARM_ARMED_HOME,
+    "ARMED_HOME": STATE_ALARM_ARMED_HOME,
+    "DISARM": STATE_ALARM_DISARMED,
+    "DISARMED": STATE_ALARM_DISARMED,
+    "READY": STATE_ALARM_DISARMED,
+    "IDLE": STATE_ALARM_DISARMED,
+    "ARMING": STATE_ALARM_ARMING,
+    "EXITDELAY": STATE_ALARM_ARMING,
+    "ENTRYDELAY": STATE_ALARM_PENDING,
+    "ALARM": STATE_ALARM_TRIGGERED,
+    "TRIGGERED": STATE_ALARM_TRIGGERED,
+}
+
+ICON_MAP = {
+    STATE_ALARM_ARMED_AWAY: "mdi:shield-lock",
+    STATE_ALARM_ARMED_HOME: "mdi:shield-home",
+    STATE_ALARM_DISARMED: "mdi:shield-check",
+    STATE_ALARM_ARMING: "mdi:shield-outline",
+}
+
+# States that are caused by a user and have a matching panel event.
+ARM_EVENTS = frozenset(
+    {STATE_ALARM_ARMED_HOME, STATE_ALARM_ARMED_AWAY, STATE_ALARM_DISARMED}
+)
+
+
+@lru_cache(maxsize=64)
+def _normalize(raw):
+    """Map a raw panel state to a Home Assistant alarm state."""
+    return STATE_MAP.get(str(raw).strip().upper(), STATE_UNKNOWN)
+
 
 def setup_platform(hass, config, add_devices, discovery_info=None):
     """Set up the Visonic Alarm platform."""
-    hub.update()
     visonic_alarm = VisonicAlarm(hass)
     add_devices([visonic_alarm])
 
-    def arm_event_listener(event):
-        """Listen for arm state changes and update last event."""
-        entity_id = event.data.get("entity_id")
-        old_state = event.data.get("old_state")
-        new_state = event.data.get("new_state")
-
-        if new_state is None or new_state.state in (STATE_UNKNOWN, ""):
-            return
-
-        if entity_id == "alarm_control_panel.visonic_alarm" and old_state.state != new_state.state:
-            state = new_state.state
-            if state in ("armed_home", "armed_away", "Disarmed"):
-                last_event = hub.alarm.get_last_event(
-                    timestamp_hour_offset=visonic_alarm.event_hour_offset
-                )
-                visonic_alarm.update_last_event(
-                    last_event["user"], last_event["timestamp"]
-                )
-
-    hass.bus.listen(EVENT_STATE_CHANGED, arm_event_listener)
-
 
 class VisonicAlarm(alarm.AlarmControlPanelEntity):
     """Representation of a Visonic Alarm control panel."""
 
     _attr_code_arm_required = False
+    _attr_should_poll = True
+    _attr_force_update = False
+    _attr_supported_features = SUPPORT_VISONIC
 
     def __init__(self, hass):
         self._hass = hass
         self._state = STATE_UNKNOWN
         self._code = hub.config.get(CONF_USER_CODE)
         self._no_pin_required = hub.config.get(CONF_NO_PIN_REQUIRED)
-        self._changed_by = None
+        self._attr_code_format = None if self._no_pin_required else "Number"
+        self._attr_changed_by = None
         self._changed_timestamp = None
         self._event_hour_offset = hub.config.get(CONF_EVENT_HOUR_OFFSET)
         self._id = hub.alarm.serial_number
+        self._last_raw = object()
+        self._cancel_last_event = None
+        self._refresh_attributes()
+
+    async def async_added_to_hass(self):
+        """Track our own state changes to pick up who armed/disarmed."""
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [self.entity_id], self._async_on_change
+            )
+        )
+        self.async_on_remove(self._async_cancel_last_event)
+
+    @callback
+    def _async_cancel_last_event(self):
+        if self._cancel_last_event is not None:
+            self._cancel_last_event()
+            self._cancel_last_event = None
+
+    @callback
+    def _async_on_change(self, event):
+        """Listen for arm state changes and update last event."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+
+        if new_state is None or new_state.state in (STATE_UNKNOWN, ""):
+            return
+
+        if old_state is not None and old_state.state != new_state.state:
+            if new_state.state in ARM_EVENTS:
+                self._async_cancel_last_event()
+                self._cancel_last_event = async_call_later(
+                    self.hass, LAST_EVENT_DELAY, self._async_fetch_last_event
+                )
+
+    async def _async_fetch_last_event(self, _now):
+        """Fetch the last panel event and record who caused it."""
+        self._cancel_last_event = None
+        last_event = await self.hass.async_add_executor_job(
+            partial(
+                hub.alarm.get_last_event,
+                timestamp_hour_offset=self.event_hour_offset,
+            )
+        )
+        if last_event is None:
+            return
+
+        self.update_last_event(last_event["user"], last_event["timestamp"])
+        self.async_write_ha_state()
 
     @property
     def name(self):
@@ -111,7 +185,11 @@ class VisonicAlarm(alarm.AlarmControlPanelEntity):
 
     @property
     def state_attributes(self):
-        return {
+        return self._attrs_cache
+
+    def _refresh_attributes(self):
+        """Rebuild the cached state attributes from the hub."""
+        self._attrs_cache = {
             ATTR_SYSTEM_SERIAL_NUMBER: hub.alarm.serial_number,
             ATTR_SYSTEM_MODEL: hub.alarm.model,
             ATTR_SYSTEM_READY: hub.alarm.ready,
@@ -119,103 +197,78 @@ class VisonicAlarm(alarm.AlarmControlPanelEntity):
             ATTR_SYSTEM_SESSION_TOKEN: hub.alarm.session_token,
             ATTR_SYSTEM_LAST_UPDATE: hub.last_update,
             ATTR_CODE_FORMAT: self.code_format,
-            ATTR_CHANGED_BY: self.changed_by,
+            ATTR_CHANGED_BY: self._attr_changed_by,
             ATTR_CHANGED_TIMESTAMP: self._changed_timestamp,
             ATTR_ALARMS: hub.alarm.alarm,
         }
 
     @property
     def icon(self):
-        if self._state == STATE_ALARM_ARMED_AWAY:
-            return "mdi:shield-lock"
-        elif self._state == STATE_ALARM_ARMED_HOME:
-            return "mdi:shield-home"
-        elif self._state == STATE_ALARM_DISARMED:
-            return "mdi:shield-check"
-        elif self._state == STATE_ALARM_ARMING:
-            return "mdi:shield-outline"
-        else:
-            return "hass:bell-ring"
+        return ICON_MAP.get(self._state, "hass:bell-ring")
 
     @property
     def state(self):
         return self._state
 
-    @property
-    def code_format(self):
-        return None if self._no_pin_required else "Number"
-
-    @property
-    def changed_by(self):
-        return self._changed_by
-
-    @property
-    def changed_timestamp(self):
-        return self._changed_timestamp
-
     @property
     def event_hour_offset(self):
         return self._event_hour_offset
 
     def update_last_event(self, user, timestamp):
-        self._changed_by = user
+        self._attr_changed_by = user
         self._changed_timestamp = timestamp
+        self._refresh_attributes()
 
     def update(self):
         """Update alarm status from the Hub."""
         hub.update()
+        self._refresh_attributes()
         raw = hub.alarm.state
-        _LOGGER.warning(f"Visonic raw state: {raw}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Visonic raw state: %s", raw)
+
+        if raw == self._last_raw:
+            return
+        self._last_raw = raw
 
         if raw is None:
             self._state = STATE_UNKNOWN
             return
 
-        status = str(raw).strip().upper()
-        _LOGGER.debug(f"Visonic normalized state: {status}")
-
-        mapping = {
-            "AWAY": STATE_ALARM_ARMED_AWAY,
-            "ARMED_AWAY": STATE_ALARM_ARMED_AWAY,
-            "ARM": STATE_ALARM_ARMED_AWAY,
-            "HOME": STATE_ALARM_ARMED_HOME,
-            "STAY": STATE_ALARM_ARMED_HOME,
-            "ARMED_HOME": STATE_ALARM_ARMED_HOME,
-            "DISARM": STATE_ALARM_DISARMED,
-            "DISARMED": STATE_ALARM_DISARMED,
-            "READY": STATE_ALARM_DISARMED,
-            "IDLE": STATE_ALARM_DISARMED,
-            "ARMING": STATE_ALARM_ARMING,
-            "EXITDELAY": STATE_ALARM_ARMING,
-            "ENTRYDELAY": STATE_ALARM_PENDING,
-            "ALARM": STATE_ALARM_TRIGGERED,
-            "TRIGGERED": STATE_ALARM_TRIGGERED,
-        }
+        self._state = _normalize(raw)
 
-        self._state = mapping.get(status, STATE_UNKNOWN)
+    def _schedule_refresh(self):
+        """Poll the panel again shortly after a command was sent."""
+        self.hass.loop.call_soon_threadsafe(
+            async_call_later, self.hass, 1, self._async_refresh
+        )
 
-    @property
-    def supported_features(self) -> int:
-        return SUPPORT_VISONIC
+    @callback
+    def _async_refresh(self, _now):
+        self.async_schedule_update_ha_state(True)
+
+    def _check_code(self, code, message, title):
+        """Validate the entered code, notifying the user if it is wrong."""
+        if self._no_pin_required or code == self._code:
+            return True
+
+        pn.create(self._hass, message, title=title)
+        return False
 
     def alarm_disarm(self, code=None):
-        if not self._no_pin_required and code != self._code:
-            pn.create(self._hass, "You entered the wrong disarm code.", title="Disarm Failed")
+        if not self._check_code(code, "You entered the wrong disarm code.", "Disarm Failed"):
             return
 
         hub.alarm.disarm()
-        sleep(1)
-        self.update()
+        self._schedule_refresh()
 
     def alarm_arm_home(self, code=None):
-        if not self._no_pin_required and code != self._code:
-            pn.create(self._hass, "You entered the wrong arm code.", title="Arm Failed")
+        if not self._check_code(code, "You entered the wrong arm code.", "Arm Failed"):
             return
 
         if hub.alarm.ready:
             hub.alarm.arm_home()
-            sleep(1)
-            self.update()
+            self._schedule_refresh()
         else:
             pn.create(
                 self._hass,
@@ -224,14 +277,12 @@ class VisonicAlarm(alarm.AlarmControlPanelEntity):
             )
 
     def alarm_arm_away(self, code=None):
-        if not self._no_pin_required and code != self._code:
-            pn.create(self._hass, "You entered the wrong arm code.", title="Unable to Arm")
+        if not self._check_code(code, "You entered the wrong arm code.", "Unable to Arm"):
             return
 
         if hub.alarm.ready:
             hub.alarm.arm_away()
-            sleep(1)
-            self.update()
+            self._schedule_refresh()
         else:
             pn.create(
                 self._hass,
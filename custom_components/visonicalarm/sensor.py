@@ -39,8 +39,6 @@ SCAN_INTERVAL = timedelta(seconds=10)
 
 def setup_platform(hass, config, add_devices, discovery_info=None):
     """Setup the Visonic Alarm platform."""
-    hub.update()
-
     for device in hub.alarm.devices:
         if device is not None:
             if device.subtype is not None: